@@ -1,8 +1,10 @@
 import pygame
+import numpy as np
 import heapq
 import time
 import random
 import math
+import json
 
 
 COLOR_BG = (10, 10, 25) 
@@ -13,13 +15,34 @@ TILE_SIZE = 30
 GRID_WIDTH = 25
 GRID_HEIGHT = 20
 PANEL_WIDTH = 320  
-WINDOW_WIDTH = GRID_WIDTH * TILE_SIZE + PANEL_WIDTH
-WINDOW_HEIGHT = GRID_HEIGHT * TILE_SIZE + 100  
+VIEW_WIDTH = 750
+VIEW_HEIGHT = 700
+WINDOW_WIDTH = VIEW_WIDTH + PANEL_WIDTH
+WINDOW_HEIGHT = VIEW_HEIGHT
+ZOOM_TILE_SIZES = [2, 3, 5, 10, 15, 30, 45, 60]
+MINIMAP_MAX_TILE = 3
+ANIMATION_MIN_TILE = 10
+CHUNK_CELLS = 16
+PAN_SPEED = 12
+CHUNK_CACHE_LIMIT = 256
+STAR_COUNT = 2000
+EFFECT_FRAMES = 32
+EFFECT_PADDING = 8
+WORMHOLE_PERIOD = 2 * math.pi / 5
+BLACKHOLE_PERIOD = math.pi / 4
+MINIMAP_COLORS = {
+    0: (0, 0, 0, 0),
+    1: (150, 0, 150, 255),
+    2: (100, 0, 100, 150),
+    3: (100, 80, 60, 255),
+    4: (0, 255, 255, 255)
+}
 FPS = 60
 COST_EMPTY = 1
 COST_NEBULA = 5
 COST_ASTEROID = 10
 COST_WORMHOLE = 2
+MAP_FILE = "cosmic_map.json"
 
 def draw_star(surface, x, y, size, color):
     points = []
@@ -93,6 +116,427 @@ def draw_rival_ship(surface, rect):
     pygame.draw.circle(surface, (255, 255, 0), (rect.right - 5, cy + 5), 2)
     pygame.draw.circle(surface, (255, 255, 0), (cx, cy + 6), 2)
 
+class Camera:
+    def __init__(self, grid_width, grid_height, view_width, view_height):
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.viewport = pygame.Rect(0, 0, view_width, view_height)
+        self.zoom_index = ZOOM_TILE_SIZES.index(TILE_SIZE)
+        self.ox = 0
+        self.oy = 0
+
+    @property
+    def tile(self):
+        return ZOOM_TILE_SIZES[self.zoom_index]
+
+    def clamp(self):
+        max_x = max(0, self.grid_width * self.tile - self.viewport.width)
+        max_y = max(0, self.grid_height * self.tile - self.viewport.height)
+        self.ox = min(max(0, self.ox), max_x)
+        self.oy = min(max(0, self.oy), max_y)
+
+    def pan(self, dx, dy):
+        self.ox += dx
+        self.oy += dy
+        self.clamp()
+
+    def zoom_at(self, step, mx, my):
+        new_index = min(max(0, self.zoom_index + step), len(ZOOM_TILE_SIZES) - 1)
+        if new_index == self.zoom_index: return
+        wx = (mx + self.ox) / self.tile
+        wy = (my + self.oy) / self.tile
+        self.zoom_index = new_index
+        self.ox = int(wx * self.tile - mx)
+        self.oy = int(wy * self.tile - my)
+        self.clamp()
+
+    def to_screen(self, wx, wy):
+        scale = self.tile / TILE_SIZE
+        return wx * scale - self.ox, wy * scale - self.oy
+
+    def cell_rect(self, gx, gy):
+        t = self.tile
+        return pygame.Rect(gx * t - self.ox, gy * t - self.oy, t, t)
+
+    def cell_center(self, gx, gy):
+        t = self.tile
+        return (gx * t - self.ox + t // 2, gy * t - self.oy + t // 2)
+
+    def screen_to_grid(self, mx, my):
+        if not self.viewport.collidepoint(mx, my): return None
+        gx, gy = (mx + self.ox) // self.tile, (my + self.oy) // self.tile
+        if 0 <= gx < self.grid_width and 0 <= gy < self.grid_height:
+            return gx, gy
+        return None
+
+    def visible_cells(self):
+        t = self.tile
+        x0, y0 = self.ox // t, self.oy // t
+        x1 = min(self.grid_width, (self.ox + self.viewport.width) // t + 1)
+        y1 = min(self.grid_height, (self.oy + self.viewport.height) // t + 1)
+        return x0, y0, x1, y1
+
+class EffectsRenderer:
+    def __init__(self, width, height, star_count):
+        rng = np.random.default_rng()
+        self.star_x = rng.integers(0, width, star_count)
+        self.star_y = rng.integers(0, height, star_count)
+        self.star_speed = rng.random(star_count)
+        self.sheets = {}
+
+    def draw_stars(self, surface, time_offset):
+        brightness = ((np.sin(time_offset * self.star_speed) + 1) * 127.5).astype(np.uint8)
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[self.star_x, self.star_y] = brightness[:, None]
+        del pixels
+
+    def get_sheet(self, cell_type, tile):
+        key = (cell_type, tile)
+        if key not in self.sheets:
+            draw_fn, period = (draw_blackhole, BLACKHOLE_PERIOD) if cell_type == 1 else (draw_wormhole, WORMHOLE_PERIOD)
+            # Black-hole spokes reach past small tiles, so each frame gets a padded cell of its own.
+            cell = tile + 2 * EFFECT_PADDING
+            sheet = pygame.Surface((cell * EFFECT_FRAMES, cell), pygame.SRCALPHA)
+            for i in range(EFFECT_FRAMES):
+                draw_fn(sheet, pygame.Rect(i * cell + EFFECT_PADDING, EFFECT_PADDING, tile, tile), period * i / EFFECT_FRAMES)
+            self.sheets[key] = sheet
+        return self.sheets[key]
+
+    def frame_area(self, period, tile, time_offset):
+        frame = int((time_offset % period) / period * EFFECT_FRAMES) % EFFECT_FRAMES
+        cell = tile + 2 * EFFECT_PADDING
+        return pygame.Rect(frame * cell, 0, cell, cell)
+
+    def draw_animated_tiles(self, surface, tiles, tile, time_offset):
+        blackhole_sheet = self.get_sheet(1, tile)
+        wormhole_sheet = self.get_sheet(4, tile)
+        blackhole_area = self.frame_area(BLACKHOLE_PERIOD, tile, time_offset)
+        wormhole_area = self.frame_area(WORMHOLE_PERIOD, tile, time_offset)
+        surface.blits([
+            (blackhole_sheet, (x - EFFECT_PADDING, y - EFFECT_PADDING), blackhole_area) if cell_type == 1
+            else (wormhole_sheet, (x - EFFECT_PADDING, y - EFFECT_PADDING), wormhole_area)
+            for (x, y), cell_type in tiles
+        ], doreturn=False)
+
+class Dashboard:
+    TEXT_CACHE_LIMIT = 512
+    TIMING_REFRESH = 0.25
+    TIMING_STRIP = 24
+    PADDING = 15
+    CONTROLS = [
+        "CONTROLS:",
+        "[1] Run UCS (Optimal)",
+        "[2] Run A* (Fast, Optimal)",
+        "[3] Run Greedy (Fastest, Subopt)", 
+        "[4] RACE MODE!", 
+        "[5] CH Index Query (Precomputed)",
+        "[SPACE] Fly Ship (after a path is found)",
+        "[M] New Map",
+        "[S] Save Map + Index  [O] Load Map",
+        "[R] Reset Search",
+        "[L-Click] Place Black Hole",
+        "[R-Click] Place Nebula",
+        "[Arrows] Scroll  [Wheel/+/-] Zoom"
+    ]
+    LEGEND = [
+        ("Start", (0, 255, 100)), ("Goal", (0, 100, 255)),
+        ("Nebula (Cost 5)", (100, 0, 100)), ("Asteroid (Cost 10)", (100, 80, 60)),
+        ("Wormhole (Teleport)", (0, 255, 255)),
+        ("Rival (Greedy)", (255, 100, 100)) 
+    ]
+
+    def __init__(self, font, title_font, rect):
+        self.font = font
+        self.title_font = title_font
+        self.rect = rect
+        self.surface = pygame.Surface(rect.size)
+        self.static_surface = None
+        self.dynamic_top = 0
+        self.text_cache = {}
+        self.state = None
+        self.timing_surface = None
+        self.timing_updated = 0.0
+
+    def text(self, font, line, color):
+        key = (id(font), line, color)
+        if key not in self.text_cache:
+            if len(self.text_cache) >= self.TEXT_CACHE_LIMIT: self.text_cache.clear()
+            self.text_cache[key] = font.render(line, True, color)
+        return self.text_cache[key]
+
+    def render_static(self):
+        surface = pygame.Surface(self.rect.size)
+        surface.fill((20, 20, 35))
+        pygame.draw.line(surface, COLOR_ACCENT, (0, 0), (0, self.rect.height), 2)
+        padding = self.PADDING
+
+        surface.blit(self.title_font.render("MISSION CONTROL", True, COLOR_ACCENT), (padding, 20))
+
+        y_off = 50 
+        for line in self.CONTROLS:
+            surface.blit(self.font.render(line, True, (180, 180, 200)), (padding, y_off))
+            y_off += 18 
+        
+        y_off += 15
+        for label, color in self.LEGEND:
+            pygame.draw.circle(surface, color, (padding + 5, y_off + 7), 5)
+            surface.blit(self.font.render(label, True, (200, 200, 200)), (padding + 20, y_off))
+            y_off += 18
+
+        self.static_surface = surface
+        self.dynamic_top = y_off + 25
+
+    def render(self, game):
+        if self.static_surface is None:
+            self.render_static()
+        surface = self.surface
+        surface.blit(self.static_surface, (0, 0))
+        padding = self.PADDING
+        y_off = self.dynamic_top
+        
+        if game.racing or game.race_winner:
+            surface.blit(self.text(self.title_font, "RACE STATUS", (255, 100, 100)), (padding, y_off))
+            y_off += 25
+            
+            status = "RACING..." if game.racing else game.race_winner
+            col = (255, 255, 255) if game.racing else ((0, 255, 0) if "YOU" in status else (255, 0, 0))
+            
+            surface.blit(self.text(self.font, status, col), (padding, y_off))
+            y_off += 40
+
+        if game.last_run and not game.racing:
+            surface.blit(self.text(self.title_font, f"LAST RUN: {game.last_run}", (255, 255, 0)), (padding, y_off))
+            y_off += 25
+            
+            s = game.stats[game.last_run]
+            
+            stats_txt = [
+                f"Nodes Expanded: {s['nodes']}",
+                f"Total Path Cost: {s['cost']}",
+                f"Compute Time: {s['time']:.4f}s"
+            ]
+            for line in stats_txt:
+                surface.blit(self.text(self.font, line, (255, 255, 255)), (padding, y_off))
+                y_off += 18
+
+            y_off += 15
+            # The chart shrinks to keep its labels clear of the timing readout strip.
+            graph_bottom = self.rect.height - self.TIMING_STRIP - 20
+            graph_h = max(40, min(100, graph_bottom - y_off))
+            graph_w = self.rect.width - (padding * 2)
+            base_y = y_off + graph_h
+            
+            pygame.draw.rect(surface, (30, 30, 45), (padding, y_off, graph_w, graph_h))
+            
+            pygame.draw.line(surface, (100, 100, 100), (padding, base_y), (padding + graph_w, base_y))
+            pygame.draw.line(surface, (100, 100, 100), (padding, y_off), (padding, base_y))
+            
+            max_nodes = max(s["nodes"] for s in game.stats.values())
+            if max_nodes == 0: max_nodes = 1
+            
+            bar_width = 30 
+            spacing = 15
+            
+            def draw_bar(key, color, x_offset):
+                val = game.stats[key]["nodes"]
+                if val > 0:
+                    h = (val / max_nodes) * (graph_h - 20)
+                    pygame.draw.rect(surface, color, (padding + x_offset, base_y - h, bar_width, h))
+                    surface.blit(self.text(self.font, str(val), (200, 200, 200)), (padding + x_offset, base_y - h - 15))
+                
+                surface.blit(self.text(self.font, key, color), (padding + x_offset, base_y + 5))
+
+            draw_bar("UCS", (255, 80, 80), 10)
+            draw_bar("A*", (80, 255, 80), 10 + bar_width + spacing)
+            draw_bar("Greedy", (80, 80, 255), 10 + (bar_width + spacing)*2)
+            draw_bar("CH", (255, 200, 80), 10 + (bar_width + spacing)*3)
+
+    def update_timing(self, frame_times):
+        now = time.time()
+        if self.timing_surface and now - self.timing_updated < self.TIMING_REFRESH: return
+        self.timing_updated = now
+        line = "update {:.1f}  search {:.1f}  draw {:.1f} ms".format(
+            frame_times["update"], frame_times["search"], frame_times["draw"])
+        self.timing_surface = self.font.render(line, True, (120, 120, 150))
+
+    def draw(self, screen, game):
+        state = (
+            game.racing, game.race_winner, game.last_run,
+            tuple((s["nodes"], s["cost"], s["time"]) for s in game.stats.values())
+        )
+        if state != self.state:
+            self.render(game)
+            self.state = state
+        screen.blit(self.surface, self.rect)
+
+        self.update_timing(game.frame_times)
+        timing_y = self.rect.bottom - self.TIMING_STRIP + (self.TIMING_STRIP - self.timing_surface.get_height()) // 2
+        screen.blit(self.timing_surface, (self.rect.left + self.PADDING, timing_y))
+
+class ContractionHierarchy:
+    WITNESS_SETTLE_LIMIT = 60
+
+    def __init__(self, width, height, rank, edges):
+        self.width = width
+        self.height = height
+        self.rank = rank
+        self.edges = edges
+        self.up_out = [[] for _ in rank]
+        self.up_in = [[] for _ in rank]
+        for (u, w), (weight, _) in edges.items():
+            if rank[w] > rank[u]:
+                self.up_out[u].append((w, weight))
+            else:
+                self.up_in[w].append((u, weight))
+
+    @classmethod
+    def build(cls, width, height, get_neighbors):
+        n = width * height
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        edges = {}
+        for y in range(height):
+            for x in range(width):
+                u = y * width + x
+                for (nx, ny), cost in get_neighbors((x, y)):
+                    w = ny * width + nx
+                    if w != u and cost < out_edges[u].get(w, float('inf')):
+                        out_edges[u][w] = cost
+                        in_edges[w][u] = cost
+                        edges[(u, w)] = (cost, -1)
+
+        contracted = [False] * n
+        deleted_neighbors = [0] * n
+
+        def witness_found(source, target, skip, limit):
+            dist = {source: 0}
+            pq = [(0, source)]
+            settled = 0
+            while pq and settled < cls.WITNESS_SETTLE_LIMIT:
+                d, node = heapq.heappop(pq)
+                if d > dist[node]: continue
+                if node == target: return True
+                settled += 1
+                for nxt, cost in out_edges[node].items():
+                    if nxt == skip or contracted[nxt]: continue
+                    nd = d + cost
+                    if nd <= limit and nd < dist.get(nxt, float('inf')):
+                        dist[nxt] = nd
+                        heapq.heappush(pq, (nd, nxt))
+            return dist.get(target, float('inf')) <= limit
+
+        def shortcuts_for(v):
+            shortcuts = []
+            for u, w_in in in_edges[v].items():
+                if contracted[u]: continue
+                for w, w_out in out_edges[v].items():
+                    if contracted[w] or w == u: continue
+                    weight = w_in + w_out
+                    if not witness_found(u, w, v, weight):
+                        shortcuts.append((u, w, weight))
+            return shortcuts
+
+        def priority(v):
+            degree = len(in_edges[v]) + len(out_edges[v])
+            return len(shortcuts_for(v)) - degree + deleted_neighbors[v]
+
+        pq = [(priority(v), v) for v in range(n)]
+        heapq.heapify(pq)
+        rank = [0] * n
+        order = 0
+        while pq:
+            _, v = heapq.heappop(pq)
+            if contracted[v]: continue
+            p = priority(v)
+            if pq and p > pq[0][0]:
+                heapq.heappush(pq, (p, v))
+                continue
+
+            for u, w, weight in shortcuts_for(v):
+                if weight < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    edges[(u, w)] = (weight, v)
+
+            contracted[v] = True
+            rank[v] = order
+            order += 1
+            for u in list(in_edges[v]):
+                del out_edges[u][v]
+                deleted_neighbors[u] += 1
+            for w in list(out_edges[v]):
+                del in_edges[w][v]
+                deleted_neighbors[w] += 1
+            in_edges[v].clear()
+            out_edges[v].clear()
+
+        return cls(width, height, rank, edges)
+
+    def to_dict(self):
+        return {
+            "width": self.width,
+            "height": self.height,
+            "rank": self.rank,
+            "edges": [[u, w, weight, middle] for (u, w), (weight, middle) in self.edges.items()]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        edges = {(u, w): (weight, middle) for u, w, weight, middle in data["edges"]}
+        return cls(data["width"], data["height"], data["rank"], edges)
+
+    def unpack(self, u, w):
+        _, middle = self.edges[(u, w)]
+        if middle == -1:
+            return [w]
+        return self.unpack(u, middle) + self.unpack(middle, w)
+
+    def query(self, start, goal):
+        s = start[1] * self.width + start[0]
+        t = goal[1] * self.width + goal[0]
+        dists = ({s: 0}, {t: 0})
+        parents = ({s: None}, {t: None})
+        queues = ([(0, s)], [(0, t)])
+        graphs = (self.up_out, self.up_in)
+        settled = set()
+        best, meeting = float('inf'), None
+
+        while queues[0] or queues[1]:
+            if min(q[0][0] if q else float('inf') for q in queues) >= best:
+                break
+            side = 0 if queues[0] and (not queues[1] or queues[0][0][0] <= queues[1][0][0]) else 1
+            d, node = heapq.heappop(queues[side])
+            if d > dists[side][node]: continue
+            settled.add(node)
+            other = dists[1 - side]
+            if node in other and d + other[node] < best:
+                best, meeting = d + other[node], node
+            for nxt, weight in graphs[side][node]:
+                nd = d + weight
+                if nd < dists[side].get(nxt, float('inf')):
+                    dists[side][nxt] = nd
+                    parents[side][nxt] = node
+                    heapq.heappush(queues[side], (nd, nxt))
+
+        settled_cells = {(v % self.width, v // self.width) for v in settled}
+        if meeting is None:
+            return float('inf'), [], settled_cells
+
+        path = [meeting]
+        node = meeting
+        while parents[0][node] is not None:
+            prev = parents[0][node]
+            path = [prev] + self.unpack(prev, node)[:-1] + path
+            node = prev
+        node = meeting
+        while parents[1][node] is not None:
+            nxt = parents[1][node]
+            path = path + self.unpack(node, nxt)
+            node = nxt
+
+        cells = [(v % self.width, v // self.width) for v in path]
+        return best, cells, settled_cells
+
 class CosmicWayfinder:
     def __init__(self):
         pygame.init()
@@ -101,6 +545,9 @@ class CosmicWayfinder:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("Verdana", 12) 
         self.title_font = pygame.font.SysFont("Verdana", 18, bold=True)
+        self.dashboard = Dashboard(self.font, self.title_font,
+                                   pygame.Rect(WINDOW_WIDTH - PANEL_WIDTH, 0, PANEL_WIDTH, WINDOW_HEIGHT))
+        self.frame_times = {"update": 0.0, "search": 0.0, "draw": 0.0}
         
         self.grid = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
         self.start = (2, GRID_HEIGHT // 2)
@@ -136,11 +583,18 @@ class CosmicWayfinder:
         self.stats = {
             "UCS": {"nodes": 0, "cost": 0, "time": 0.0},
             "A*":  {"nodes": 0, "cost": 0, "time": 0.0},
-            "Greedy": {"nodes": 0, "cost": 0, "time": 0.0} 
+            "Greedy": {"nodes": 0, "cost": 0, "time": 0.0},
+            "CH": {"nodes": 0, "cost": 0, "time": 0.0}
         }
+        self.ch_index = None
         self.last_run = None 
 
-        self.stars = [(random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT), random.random()) for _ in range(50)]
+        self.effects = EffectsRenderer(WINDOW_WIDTH, WINDOW_HEIGHT, STAR_COUNT)
+
+        self.camera = Camera(GRID_WIDTH, GRID_HEIGHT, VIEW_WIDTH, VIEW_HEIGHT)
+        self.nebula_tile = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+        self.nebula_tile.fill((100, 0, 100, 100))
+        self.invalidate_terrain()
 
         self.generate_random_map()
 
@@ -152,6 +606,8 @@ class CosmicWayfinder:
         self.frontier = []
         self.last_run = None
         self.animating_ship = False 
+        self.ch_index = None
+        self.invalidate_terrain()
    
         for y in range(GRID_HEIGHT):
             for x in range(GRID_WIDTH):
@@ -190,8 +646,100 @@ class CosmicWayfinder:
                 self.grid[y2][x2] = 4
                 self.wormholes[(x1, y1)] = (x2, y2)
                 self.wormholes[(x2, y2)] = (x1, y1)
+
+        self.build_ch_index()
  
 
+    def show_status(self, message):
+        self.draw()
+        text = self.title_font.render(message, True, COLOR_ACCENT)
+        box = text.get_rect(center=self.camera.viewport.center).inflate(30, 20)
+        pygame.draw.rect(self.screen, (20, 20, 35), box)
+        pygame.draw.rect(self.screen, COLOR_ACCENT, box, 2)
+        self.screen.blit(text, text.get_rect(center=box.center))
+        pygame.display.flip()
+
+    def build_ch_index(self):
+        self.show_status("BUILDING CH INDEX...")
+        self.ch_index = ContractionHierarchy.build(GRID_WIDTH, GRID_HEIGHT, self.get_neighbors)
+
+    def solve_ch(self):
+        if self.ch_index is None:
+            self.build_ch_index()
+
+        start_time = time.time()
+        cost, path, settled = self.ch_index.query(self.start, self.goal)
+        elapsed = time.time() - start_time
+
+        self.path = path
+        self.visited = settled
+        self.frontier = []
+        if path:
+            self.stats["CH"] = {"nodes": len(settled), "cost": cost, "time": elapsed}
+        self.last_run = "CH"
+
+    def save_map(self, filename=MAP_FILE):
+        if self.ch_index is None:
+            self.build_ch_index()
+        data = {
+            "grid": self.grid,
+            "start": self.start,
+            "goal": self.goal,
+            "wormholes": [[a[0], a[1], b[0], b[1]] for a, b in self.wormholes.items()],
+            "ch_index": self.ch_index.to_dict()
+        }
+        try:
+            with open(filename, "w") as f:
+                json.dump(data, f)
+        except OSError:
+            return False
+        return True
+
+    def load_map(self, filename=MAP_FILE):
+        try:
+            with open(filename) as f:
+                data = json.load(f)
+
+            grid = data["grid"]
+            if len(grid) != GRID_HEIGHT or any(len(row) != GRID_WIDTH for row in grid):
+                return False
+            if any(type(val) is not int or val not in MINIMAP_COLORS for row in grid for val in row):
+                return False
+            start = tuple(data["start"])
+            goal = tuple(data["goal"])
+            wormholes = {(x1, y1): (x2, y2) for x1, y1, x2, y2 in data["wormholes"]}
+            cells = [start, goal] + list(wormholes) + list(wormholes.values())
+            if not all(self.is_grid_cell(cell) for cell in cells):
+                return False
+
+            ch_index = None
+            if "ch_index" in data:
+                index = data["ch_index"]
+                if (index["width"], index["height"]) == (GRID_WIDTH, GRID_HEIGHT) and \
+                        len(index["rank"]) == GRID_WIDTH * GRID_HEIGHT:
+                    ch_index = ContractionHierarchy.from_dict(index)
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            return False
+
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.wormholes = wormholes
+        self.ch_index = ch_index
+        self.invalidate_terrain()
+        self.path = []
+        self.visited = set()
+        self.frontier = []
+        self.last_run = None
+        self.animating_ship = False
+        if self.ch_index is None:
+            self.build_ch_index()
+        return True
+
+    def is_grid_cell(self, pos):
+        return (len(pos) == 2 and all(type(v) is int for v in pos)
+                and 0 <= pos[0] < GRID_WIDTH and 0 <= pos[1] < GRID_HEIGHT)
+
     def get_cost(self, pos):
         x, y = pos
         if not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT): return float('inf')
@@ -472,183 +1020,174 @@ class CosmicWayfinder:
             ship['x'] = -20
             ship['y'] = random.randint(0, WINDOW_HEIGHT)
 
-    def draw_dashboard(self):
-        panel_rect = pygame.Rect(WINDOW_WIDTH - PANEL_WIDTH, 0, PANEL_WIDTH, WINDOW_HEIGHT)
-        pygame.draw.rect(self.screen, (20, 20, 35), panel_rect)
-        pygame.draw.line(self.screen, COLOR_ACCENT, (panel_rect.left, 0), (panel_rect.left, WINDOW_HEIGHT), 2)
-
-        padding = 15
-        
-        title = self.title_font.render("MISSION CONTROL", True, COLOR_ACCENT)
-        self.screen.blit(title, (panel_rect.left + padding, 20))
-
-        y_off = 50 
-        instr = [
-            "CONTROLS:",
-            "[1] Run UCS (Optimal)",
-            "[2] Run A* (Fast, Optimal)",
-            "[3] Run Greedy (Fastest, Subopt)", 
-            "[4] RACE MODE!", 
-            "[SPACE] Fly Ship (after a path is found)",
-            "[M] New Map",
-            "[R] Reset Search",
-            "[L-Click] Place Black Hole",
-            "[R-Click] Place Nebula"
-        ]
-        for line in instr:
-            color = (180, 180, 200)
-            txt = self.font.render(line, True, color)
-            self.screen.blit(txt, (panel_rect.left + padding, y_off))
-            y_off += 18 
-        
-        y_off += 15
-        legend_items = [
-            ("Start", (0, 255, 100)), ("Goal", (0, 100, 255)),
-            ("Nebula (Cost 5)", (100, 0, 100)), ("Asteroid (Cost 10)", (100, 80, 60)),
-            ("Wormhole (Teleport)", (0, 255, 255)),
-            ("Rival (Greedy)", (255, 100, 100)) 
-        ]
-        for label, color in legend_items:
-            pygame.draw.circle(self.screen, color, (panel_rect.left + padding + 5, y_off + 7), 5)
-            txt = self.font.render(label, True, (200, 200, 200))
-            self.screen.blit(txt, (panel_rect.left + padding + 20, y_off))
-            y_off += 18
-
-        y_off += 25
-        
-        if self.racing or self.race_winner:
-            header = self.title_font.render("RACE STATUS", True, (255, 100, 100))
-            self.screen.blit(header, (panel_rect.left + padding, y_off))
-            y_off += 25
-            
-            status = "RACING..." if self.racing else self.race_winner
-            col = (255, 255, 255) if self.racing else ((0, 255, 0) if "YOU" in status else (255, 0, 0))
-            
-            s_txt = self.font.render(status, True, col)
-            self.screen.blit(s_txt, (panel_rect.left + padding, y_off))
-            y_off += 40
-
-        if self.last_run and not self.racing:
-            header = self.title_font.render(f"LAST RUN: {self.last_run}", True, (255, 255, 0))
-            self.screen.blit(header, (panel_rect.left + padding, y_off))
-            y_off += 25
-            
-            s = self.stats[self.last_run]
-            
-            stats_txt = [
-                f"Nodes Expanded: {s['nodes']}",
-                f"Total Path Cost: {s['cost']}",
-                f"Compute Time: {s['time']:.4f}s"
-            ]
-            for line in stats_txt:
-                t = self.font.render(line, True, (255, 255, 255))
-                self.screen.blit(t, (panel_rect.left + padding, y_off))
-                y_off += 18
-
-            y_off += 15
-            graph_h = 100 
-            graph_w = PANEL_WIDTH - (padding * 2)
-            base_y = y_off + graph_h
-            
-            pygame.draw.rect(self.screen, (30, 30, 45), (panel_rect.left + padding, y_off, graph_w, graph_h))
-            
-            pygame.draw.line(self.screen, (100, 100, 100), (panel_rect.left + padding, base_y), (panel_rect.left + padding + graph_w, base_y))
-            pygame.draw.line(self.screen, (100, 100, 100), (panel_rect.left + padding, y_off), (panel_rect.left + padding, base_y))
-            
-            max_nodes = max(self.stats["UCS"]["nodes"], self.stats["A*"]["nodes"], self.stats["Greedy"]["nodes"])
-            if max_nodes == 0: max_nodes = 1
-            
-            bar_width = 30 
-            spacing = 15
-            
-            def draw_bar(key, color, x_offset):
-                val = self.stats[key]["nodes"]
-                if val > 0:
-                    h = (val / max_nodes) * (graph_h - 20)
-                    pygame.draw.rect(self.screen, color, 
-                                   (panel_rect.left + padding + x_offset, base_y - h, bar_width, h))
-                    val_txt = self.font.render(str(val), True, (200, 200, 200))
-                    self.screen.blit(val_txt, (panel_rect.left + padding + x_offset, base_y - h - 15))
-                
-                lbl = self.font.render(key, True, color)
-                self.screen.blit(lbl, (panel_rect.left + padding + x_offset, base_y + 5))
+    def invalidate_terrain(self):
+        self.chunks = {}
+        self.scaled_chunks = {}
+        self.minimap = None
+
+    def invalidate_cell(self, x, y):
+        key = (x // CHUNK_CELLS, y // CHUNK_CELLS)
+        self.chunks.pop(key, None)
+        for tile in ZOOM_TILE_SIZES:
+            self.scaled_chunks.pop(key + (tile,), None)
+        if self.minimap:
+            self.minimap.set_at((x, y), MINIMAP_COLORS[self.grid[y][x]])
+
+    def render_chunk(self, cx, cy):
+        x0, y0 = cx * CHUNK_CELLS, cy * CHUNK_CELLS
+        x1, y1 = min(GRID_WIDTH, x0 + CHUNK_CELLS), min(GRID_HEIGHT, y0 + CHUNK_CELLS)
+        surface = pygame.Surface(((x1 - x0) * TILE_SIZE, (y1 - y0) * TILE_SIZE), pygame.SRCALPHA)
+        animated = []
+
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                rect = pygame.Rect((x - x0) * TILE_SIZE, (y - y0) * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                cell_type = self.grid[y][x]
+                pygame.draw.rect(surface, COLOR_GRID, rect, 1)
+
+                if cell_type == 2:
+                    surface.blit(self.nebula_tile, rect)
+                elif cell_type == 3:
+                    draw_asteroid(surface, rect)
+                elif cell_type in (1, 4):
+                    animated.append((x, y, cell_type))
+        return surface, animated
+
+    def get_chunk(self, cx, cy, tile):
+        key = (cx, cy, tile)
+        if key not in self.scaled_chunks:
+            if (cx, cy) not in self.chunks:
+                if len(self.chunks) >= CHUNK_CACHE_LIMIT: self.chunks.clear()
+                self.chunks[(cx, cy)] = self.render_chunk(cx, cy)
+            base, animated = self.chunks[(cx, cy)]
+
+            if tile == TILE_SIZE:
+                surface = base
+            else:
+                size = (base.get_width() * tile // TILE_SIZE, base.get_height() * tile // TILE_SIZE)
+                surface = pygame.transform.scale(base, size)
+
+            # Animated tiles are too small to read below this size, so bake in a flat marker.
+            if tile < ANIMATION_MIN_TILE:
+                for x, y, cell_type in animated:
+                    rect = ((x - cx * CHUNK_CELLS) * tile, (y - cy * CHUNK_CELLS) * tile, tile, tile)
+                    surface.fill(MINIMAP_COLORS[cell_type], rect)
+
+            if len(self.scaled_chunks) >= CHUNK_CACHE_LIMIT: self.scaled_chunks.clear()
+            self.scaled_chunks[key] = (surface, animated)
+        return self.scaled_chunks[key]
+
+    def get_minimap(self):
+        if self.minimap is None:
+            self.minimap = pygame.Surface((GRID_WIDTH, GRID_HEIGHT), pygame.SRCALPHA)
+            for y in range(GRID_HEIGHT):
+                for x in range(GRID_WIDTH):
+                    self.minimap.set_at((x, y), MINIMAP_COLORS[self.grid[y][x]])
+        return self.minimap
+
+    def draw_terrain(self, time_offset):
+        cam = self.camera
+        tile = cam.tile
+        x0, y0, x1, y1 = cam.visible_cells()
+        if x1 <= x0 or y1 <= y0: return
+
+        if tile <= MINIMAP_MAX_TILE:
+            area = pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+            scaled = pygame.transform.scale(self.get_minimap().subsurface(area), (area.width * tile, area.height * tile))
+            self.screen.blit(scaled, (x0 * tile - cam.ox, y0 * tile - cam.oy))
+            return
+
+        animated_tiles = []
+        for cy in range(y0 // CHUNK_CELLS, (y1 - 1) // CHUNK_CELLS + 1):
+            for cx in range(x0 // CHUNK_CELLS, (x1 - 1) // CHUNK_CELLS + 1):
+                surface, animated = self.get_chunk(cx, cy, tile)
+                self.screen.blit(surface, (cx * CHUNK_CELLS * tile - cam.ox, cy * CHUNK_CELLS * tile - cam.oy))
+
+                if tile < ANIMATION_MIN_TILE: continue
+                for x, y, cell_type in animated:
+                    if x0 <= x < x1 and y0 <= y < y1:
+                        animated_tiles.append(((x * tile - cam.ox, y * tile - cam.oy), cell_type))
+
+        # One blit per visible animated tile, copied from a pre-rendered sheet. Baking frames into
+        # the chunks instead would keep EFFECT_FRAMES copies of every chunk for each animation.
+        if animated_tiles:
+            self.effects.draw_animated_tiles(self.screen, animated_tiles, tile, time_offset)
+
+    def record_frame_time(self, key, seconds):
+        self.frame_times[key] = self.frame_times[key] * 0.9 + seconds * 1000 * 0.1
 
-            draw_bar("UCS", (255, 80, 80), 10)
-            draw_bar("A*", (80, 255, 80), 10 + bar_width + spacing)
-            draw_bar("Greedy", (80, 80, 255), 10 + (bar_width + spacing)*2) # Added Greedy Bar
+    def draw_dashboard(self):
+        self.dashboard.draw(self.screen, self)
 
     def draw(self):
         self.screen.fill(COLOR_BG)
         time_offset = time.time()
         
-        for sx, sy, sb in self.stars:
-            b = int(255 * (math.sin(time_offset * sb) + 1) / 2)
-            self.screen.set_at((sx, sy), (b, b, b))
+        self.effects.draw_stars(self.screen, time_offset)
             
-        for ship in self.bg_ships:
-            pygame.draw.rect(self.screen, (50, 50, 70), (ship['x'], ship['y'], ship['size'], ship['size']//2))
-            pygame.draw.circle(self.screen, (100, 100, 150), (ship['x'] + ship['size']//2, ship['y']), 2)
+        cam = self.camera
+        tile = cam.tile
+        scale = tile / TILE_SIZE
+        self.screen.set_clip(cam.viewport)
 
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                
-                cell_type = self.grid[y][x]
-                
-                pygame.draw.rect(self.screen, COLOR_GRID, rect, 1)
-
-                if cell_type == 1: 
-                    draw_blackhole(self.screen, rect, time_offset)
-                elif cell_type == 2: 
-                    s = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                    s.fill((100, 0, 100, 100)) 
-                    self.screen.blit(s, rect)
-                elif cell_type == 3: 
-                    draw_asteroid(self.screen, rect)
-                elif cell_type == 4: 
-                    draw_wormhole(self.screen, rect, time_offset)
-                    if (x,y) in self.wormholes:
-                        target = self.wormholes[(x,y)]
-                        if (x < target[0]) or (x == target[0] and y < target[1]):
-                            start_pos = rect.center
-                            end_pos = (target[0] * TILE_SIZE + TILE_SIZE//2, target[1] * TILE_SIZE + TILE_SIZE//2)
-                            pygame.draw.line(self.screen, (0, 100, 100), start_pos, end_pos, 1)
-
-        for vx, vy in self.visited:
+        for ship in self.bg_ships:
+            bx, by = cam.to_screen(ship['x'], ship['y'])
+            size = ship['size'] * scale
+            pygame.draw.rect(self.screen, (50, 50, 70), (bx, by, size, size // 2))
+            pygame.draw.circle(self.screen, (100, 100, 150), (bx + size // 2, by), 2)
+
+        self.draw_terrain(time_offset)
+
+        for (x, y), target in self.wormholes.items():
+            if (x < target[0]) or (x == target[0] and y < target[1]):
+                pygame.draw.line(self.screen, (0, 100, 100), cam.cell_center(x, y), cam.cell_center(*target), 1)
+
+        x0, y0, x1, y1 = cam.visible_cells()
+        if tile <= MINIMAP_MAX_TILE:
+            visible_visited = []
+        elif len(self.visited) > (x1 - x0) * (y1 - y0):
+            visible_visited = [(x, y) for y in range(y0, y1) for x in range(x0, x1) if (x, y) in self.visited]
+        else:
+            visible_visited = [(vx, vy) for vx, vy in self.visited if x0 <= vx < x1 and y0 <= vy < y1]
+        dot_radius = max(1, tile // 15)
+        for vx, vy in visible_visited:
             if (vx, vy) != self.start and (vx, vy) != self.goal:
-                center = (vx * TILE_SIZE + TILE_SIZE//2, vy * TILE_SIZE + TILE_SIZE//2)
-                pygame.draw.circle(self.screen, (50, 50, 100), center, 2)
+                pygame.draw.circle(self.screen, (50, 50, 100), cam.cell_center(vx, vy), dot_radius)
 
         if len(self.path) > 1:
             for i in range(len(self.path) - 1):
                 p1 = self.path[i]
                 p2 = self.path[i+1]
                 
-                pos1 = (p1[0] * TILE_SIZE + TILE_SIZE//2, p1[1] * TILE_SIZE + TILE_SIZE//2)
-                pos2 = (p2[0] * TILE_SIZE + TILE_SIZE//2, p2[1] * TILE_SIZE + TILE_SIZE//2)
-                
                 dist = abs(p1[0] - p2[0]) + abs(p1[1] - p2[1])
+                if dist == 1 and not any(x0 <= px < x1 and y0 <= py < y1 for px, py in (p1, p2)):
+                    continue
+
+                pos1 = cam.cell_center(*p1)
+                pos2 = cam.cell_center(*p2)
                 
                 if dist > 1: 
-                    pygame.draw.line(self.screen, (0, 255, 255), pos1, pos2, 2) 
+                    pygame.draw.line(self.screen, (0, 255, 255), pos1, pos2, max(1, tile // 15)) 
                 else:
-                    pygame.draw.line(self.screen, (200, 200, 50), pos1, pos2, 4) 
+                    pygame.draw.line(self.screen, (200, 200, 50), pos1, pos2, max(1, tile * 2 // 15)) 
 
         if self.racing or self.race_winner:
             if self.rival_pos:
-                rect = pygame.Rect(self.rival_pos[0], self.rival_pos[1], TILE_SIZE, TILE_SIZE)
-                draw_rival_ship(self.screen, rect)
+                rx, ry = cam.to_screen(*self.rival_pos)
+                draw_rival_ship(self.screen, pygame.Rect(rx, ry, tile, tile))
 
         sx, sy = self.start
         gx, gy = self.goal
         
         if not self.animating_ship and not self.racing and not self.race_winner:
-            draw_ship(self.screen, pygame.Rect(sx * TILE_SIZE, sy * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+            draw_ship(self.screen, cam.cell_rect(sx, sy))
         else:
             if self.ship_pos:
-                draw_animated_ship(self.screen, self.ship_pos[0], self.ship_pos[1], TILE_SIZE)
+                draw_animated_ship(self.screen, *cam.to_screen(*self.ship_pos), tile)
 
-        draw_planet(self.screen, pygame.Rect(gx * TILE_SIZE, gy * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+        draw_planet(self.screen, cam.cell_rect(gx, gy))
+
+        self.screen.set_clip(None)
 
         self.draw_dashboard()
 
@@ -657,20 +1196,31 @@ class CosmicWayfinder:
     def run(self):
         running = True
         while running:
+            frame_start = time.perf_counter()
+            pending_search = None
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mx, my = pygame.mouse.get_pos()
-                    gx, gy = mx // TILE_SIZE, my // TILE_SIZE
+                    cell = self.camera.screen_to_grid(*event.pos)
                     
-                    if 0 <= gx < GRID_WIDTH and 0 <= gy < GRID_HEIGHT:
+                    if cell:
+                        gx, gy = cell
                         if (gx, gy) != self.start and (gx, gy) != self.goal:
                             if event.button == 1: 
                                 self.grid[gy][gx] = 1 if self.grid[gy][gx] != 1 else 0
+                                self.ch_index = None
+                                self.invalidate_cell(gx, gy)
                             elif event.button == 3: 
                                 self.grid[gy][gx] = 2 if self.grid[gy][gx] != 2 else 0
+                                self.ch_index = None
+                                self.invalidate_cell(gx, gy)
+
+                if event.type == pygame.MOUSEWHEEL and event.y:
+                    mx, my = pygame.mouse.get_pos()
+                    if self.camera.viewport.collidepoint(mx, my):
+                        self.camera.zoom_at(1 if event.y > 0 else -1, mx, my)
                 
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_1:
@@ -697,7 +1247,13 @@ class CosmicWayfinder:
                         self.racing = False 
                         self.race_winner = None
                     elif event.key == pygame.K_4: 
-                        self.start_race()
+                        pending_search = self.start_race
+                    elif event.key == pygame.K_5:
+                        pending_search = self.solve_ch
+                        self.running_algo = False
+                        self.animating_ship = False
+                        self.racing = False
+                        self.race_winner = None
                     elif event.key == pygame.K_SPACE:
                         if self.path:
                             self.animating_ship = True
@@ -707,6 +1263,16 @@ class CosmicWayfinder:
                         self.generate_random_map()
                         self.racing = False # 
                         self.race_winner = None
+                    elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                        self.camera.zoom_at(1, VIEW_WIDTH // 2, VIEW_HEIGHT // 2)
+                    elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                        self.camera.zoom_at(-1, VIEW_WIDTH // 2, VIEW_HEIGHT // 2)
+                    elif event.key == pygame.K_s:
+                        self.save_map()
+                    elif event.key == pygame.K_o:
+                        if self.load_map():
+                            self.racing = False
+                            self.race_winner = None
                     elif event.key == pygame.K_r:
                         self.path = []
                         self.visited = set()
@@ -715,11 +1281,21 @@ class CosmicWayfinder:
                         self.racing = False # 
                         self.race_winner = None
 
+            keys = pygame.key.get_pressed()
+            pan_x = (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * PAN_SPEED
+            pan_y = (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * PAN_SPEED
+            if pan_x or pan_y:
+                self.camera.pan(pan_x, pan_y)
+
+            search_start = time.perf_counter()
+            if pending_search:
+                pending_search()
             if self.running_algo:
                 try:
                     next(self.algo_generator)
                 except StopIteration:
                     self.running_algo = False
+            search_end = time.perf_counter()
             
             if self.animating_ship:
                 self.update_animation()
@@ -734,7 +1310,13 @@ class CosmicWayfinder:
                         ship['x'] = -20
                         ship['y'] = random.randint(0, WINDOW_HEIGHT)
 
+            draw_start = time.perf_counter()
             self.draw()
+            draw_end = time.perf_counter()
+
+            self.record_frame_time("update", (search_start - frame_start) + (draw_start - search_end))
+            self.record_frame_time("search", search_end - search_start)
+            self.record_frame_time("draw", draw_end - draw_start)
             self.clock.tick(FPS)
 
         pygame.quit()